@@ -80,7 +80,7 @@ class Response(object):
         source_routers = set()
 
         first = True
-        for item in re.split('\n\n', message):
+        for item in message.split('\n\n'):
             ingress = re.search('ingress:(.+?) vrf:', item)
             if ingress and ingress.group(1):
                 source_routers.add(ingress.group(1))
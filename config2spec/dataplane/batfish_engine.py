@@ -13,6 +13,10 @@ from config2spec.dataplane.fecs import FECFinder
 from config2spec.dataplane.fib import ForwardingTable
 
 
+# compiled once, the FIB files are parsed line by line
+_ROUTER_RE = re.compile(r"^# Router:([a-zA-Z0-9\-_&]+)$")
+_VRF_RE = re.compile(r"^## VRF:([a-zA-Z0-9\-]+)$")
+
 # Network topology that relies on Batfish for the dataplane computation and
 # simply parses the FIB files produced by Batfish.
 
@@ -77,11 +81,11 @@ class BatfishEngine(object):
                 line = line.strip()
 
                 if line.startswith("# "):
-                    router_match = re.match("^# Router:([a-zA-Z0-9\-_&]+)$", line)
+                    router_match = _ROUTER_RE.match(line)
                     router = router_match.group(1) if router_match else "unknown"
 
                 elif line.startswith("## "):
-                    vrf_match = re.match("^## VRF:([a-zA-Z0-9\-]+)$", line)
+                    vrf_match = _VRF_RE.match(line)
                     current_vrf = vrf_match.group(1) if vrf_match else "unknown"
 
                 elif current_vrf == vrf:
@@ -3,8 +3,10 @@
 
 
 from enum import Enum
+from functools import total_ordering
 
 
+@total_ordering
 class PolicyType(Enum):
     Reachability = 1
     Isolation = 2
@@ -13,48 +15,41 @@ class PolicyType(Enum):
     LoadBalancingEdgeDisjoint = 5
     LoadBalancingNodeDisjoint = 6
 
-    def __ge__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value >= other.value
-        return NotImplemented
-
-    def __gt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value > other.value
-        return NotImplemented
-
-    def __le__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value <= other.value
-        return NotImplemented
-
     def __lt__(self, other):
         if self.__class__ is other.__class__:
             return self.value < other.value
         return NotImplemented
 
 
+@total_ordering
 class PolicySource(object):
+    __slots__ = ("router", "_str", "_hash")
+
+    # canonical instance for each router, see get(). The cache lives as long as the process unless it is cleared.
+    _cache = dict()
+
     def __init__(self, router):
         self.router = router
+        # sources are always used as keys, so the string and hash are computed right away
+        self._str = router
+        self._hash = hash(router)
+
+    @classmethod
+    def get(cls, router):
+        """
+        Returns the shared source for the router. Creating the object directly bypasses the cache.
+        """
+        source = cls._cache.get(router)
+        if source is None:
+            source = cls._cache[router] = cls(router)
+        return source
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
 
     def __str__(self):
-        return self.router
-
-    def __ge__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router >= other.router
-        return NotImplemented
-
-    def __gt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router > other.router
-        return NotImplemented
-
-    def __le__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router <= other.router
-        return NotImplemented
+        return self._str
 
     def __lt__(self, other):
         if self.__class__ is other.__class__:
@@ -62,70 +57,95 @@ class PolicySource(object):
         return NotImplemented
 
     def __eq__(self, other):
-        if type(other) == PolicySource:
-            return self.router == other.router
-        else:
-            return False
+        if self is other:
+            return True
+        return other.__class__ is PolicySource and self.router == other.router
 
     def __hash__(self):
-        return hash(self.__str__())
+        return self._hash
 
 
+@total_ordering
 class PolicyDestination(object):
+    __slots__ = ("router", "interface", "subnet", "_str", "_hash")
+
+    # canonical instance for each (router, interface, subnet), see get(). The cache lives as long as the process
+    # unless it is cleared.
+    _cache = dict()
+
     def __init__(self, router, interface, subnet):
         self.router = router
         self.interface = interface
         self.subnet = subnet
 
-    def __str__(self):
-        return "{router}:{interface} ({subnet})".format(
-            router=self.router, interface=self.interface, subnet=self.subnet)
+        # destinations are always used as keys, so the string and hash are computed right away
+        self._str = f"{router}:{interface} ({subnet})"
+        self._hash = hash((router, interface, subnet))
+
+    @classmethod
+    def get(cls, router, interface, subnet):
+        """
+        Returns the shared destination for the interface and subnet. Creating the object directly bypasses the cache.
+        """
+        key = (router, interface, subnet)
+        destination = cls._cache.get(key)
+        if destination is None:
+            destination = cls._cache[key] = cls(router, interface, subnet)
+        return destination
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
 
-    def __ge__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router >= other.router
-        return NotImplemented
-
-    def __gt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router > other.router
-        return NotImplemented
-
-    def __le__(self, other):
-        if self.__class__ is other.__class__:
-            return self.router <= other.router
-        return NotImplemented
+    def __str__(self):
+        return self._str
 
     def __lt__(self, other):
         if self.__class__ is other.__class__:
-            return self.router < other.router
+            return (self.router, self.interface, self.subnet) < (other.router, other.interface, other.subnet)
         return NotImplemented
 
     def __eq__(self, other):
-        if type(other) == PolicyDestination:
-            return self.router == other.router and self.interface == other.interface and self.subnet == other.subnet
-        else:
-            return False
+        if self is other:
+            return True
+        return other.__class__ is PolicyDestination and self.router == other.router and \
+            self.interface == other.interface and self.subnet == other.subnet
 
     def __hash__(self):
-        return hash(self.__str__())
+        return self._hash
 
 
 class Policy(object):
+    # policies are never modified after creation, hence their string and hash are computed only once
+    __slots__ = ("type", "sources", "destinations", "negate", "_str", "_hash")
+
     def __init__(self, type, sources, destinations, negate=False):
         self.type = type
-        self.sources = sources  # list of PolicySource objects
-        self.destinations = destinations  # list of PolicyDestination objects
+        self.sources = tuple(sources)  # tuple of PolicySource objects
+        self.destinations = tuple(destinations)  # tuple of PolicyDestination objects
         self.negate = negate
 
+        self._str = None
+        self._hash = None
+
     def __str__(self):
-        sources_str = "{{{sources}}}".format(sources=", ".join(str(source) for source in self.sources))
-        destinations_str = "{{{destinations}}}".format(
-            destinations=", ".join(str(destination) for destination in self.destinations))
-        return "{policy_type} policy: {sources}->{destinations}, negate={negated}".format(
-            policy_type=self.type, sources=sources_str, destinations=destinations_str, negated=self.negate)
+        if self._str is None:
+            self._str = self.to_string()
+        return self._str
+
+    def to_string(self):
+        # sources and destinations precompute their strings
+        sources_str = ", ".join(source._str for source in self.sources)
+        destinations_str = ", ".join(destination._str for destination in self.destinations)
+        return f"{self.type} policy: {{{sources_str}}}->{{{destinations_str}}}, negate={self.negate}"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        # the hash is cached, so comparing it first is cheap and rules out most unequal policies
+        if not isinstance(other, Policy) or hash(self) != hash(other):
+            return False
+
         if self.type == other.type and self.sources == other.sources and \
                 self.destinations == other.destinations and self.negate == other.negate:
             return True
@@ -133,7 +153,12 @@ class Policy(object):
             return False
 
     def __hash__(self):
-        return hash(self.__str__())
+        if self._hash is None:
+            self._hash = hash(self.hash_key())
+        return self._hash
+
+    def hash_key(self):
+        return self.type, self.sources, self.destinations, self.negate
 
     def get_coverage(self):
         coverage = len(self.sources) * len(self.destinations)
@@ -141,33 +166,35 @@ class Policy(object):
 
     @staticmethod
     def get_policy(policy_type, sources, destinations, specifics):
-        if policy_type == PolicyType.Reachability:
-            policy = ReachabilityPolicy(sources, destinations, negate=False)
-        elif policy_type == PolicyType.Isolation:
-            policy = ReachabilityPolicy(sources, destinations, negate=True)
-        elif policy_type == PolicyType.Waypoint:
-            policy = WaypointPolicy(sources, destinations, waypoints=specifics)
-        elif policy_type == PolicyType.LoadBalancingSimple:
-            policy = LoadBalancingPolicy(sources, destinations, num_paths=specifics)
+        constructor = _POLICY_CONSTRUCTORS.get(policy_type)
+        if constructor:
+            policy = constructor(sources, destinations, specifics)
         else:
             policy = None
         return policy
 
 
 class ReachabilityPolicy(Policy):
+    __slots__ = ()
+
     def __init__(self, sources, destinations, negate=False):
         super(ReachabilityPolicy, self).__init__("reachability", sources, destinations, negate=negate)
 
 
 class LoadBalancingPolicy(Policy):
+    __slots__ = ("num_paths",)
+
     def __init__(self, sources, destinations, num_paths):
         super(LoadBalancingPolicy, self).__init__("loadbalancing", sources, destinations)
         self.num_paths = num_paths
 
-    def __str__(self):
-        output = super(LoadBalancingPolicy, self).__str__()
+    def to_string(self):
+        output = super(LoadBalancingPolicy, self).to_string()
         return '%s - NumPaths %d' % (output, self.num_paths)
 
+    def hash_key(self):
+        return super(LoadBalancingPolicy, self).hash_key() + (self.num_paths,)
+
     def __eq__(self, other):
         if super(LoadBalancingPolicy, self).__eq__(other) and self.num_paths == other.num_paths:
             return True
@@ -175,17 +202,24 @@ class LoadBalancingPolicy(Policy):
             return False
 
     def __hash__(self):
-        return hash(self.__str__())
+        return super(LoadBalancingPolicy, self).__hash__()
 
 
 class WaypointPolicy(Policy):
+    __slots__ = ("waypoints",)
+
     def __init__(self, sources, destinations, waypoints):
         super(WaypointPolicy, self).__init__("waypoint", sources, destinations)
         self.waypoints = waypoints
 
-    def __str__(self):
-        output = super(WaypointPolicy, self).__str__()
-        return "{policy_string} - Waypoints {waypoints}".format(policy_string=output, waypoints=self.waypoints)
+    def to_string(self):
+        output = super(WaypointPolicy, self).to_string()
+        return f"{output} - Waypoints {self.waypoints}"
+
+    def hash_key(self):
+        # waypoints are either a single router or a list of routers
+        waypoints = tuple(self.waypoints) if isinstance(self.waypoints, list) else self.waypoints
+        return super(WaypointPolicy, self).hash_key() + (waypoints,)
 
     def __eq__(self, other):
         if super(WaypointPolicy, self).__eq__(other) and self.waypoints == other.waypoints:
@@ -194,4 +228,17 @@ class WaypointPolicy(Policy):
             return False
 
     def __hash__(self):
-        return hash(self.__str__())
\ No newline at end of file
+        return super(WaypointPolicy, self).__hash__()
+
+
+# maps each policy type to a function creating the policy from its sources, destinations and specifics
+_POLICY_CONSTRUCTORS = {
+    PolicyType.Reachability:
+        lambda sources, destinations, specifics: ReachabilityPolicy(sources, destinations, negate=False),
+    PolicyType.Isolation:
+        lambda sources, destinations, specifics: ReachabilityPolicy(sources, destinations, negate=True),
+    PolicyType.Waypoint:
+        lambda sources, destinations, specifics: WaypointPolicy(sources, destinations, waypoints=specifics),
+    PolicyType.LoadBalancingSimple:
+        lambda sources, destinations, specifics: LoadBalancingPolicy(sources, destinations, num_paths=specifics),
+}
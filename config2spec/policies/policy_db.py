@@ -163,7 +163,7 @@ class PolicyDB(object):
 
     def get_policy(self, status=None, group=False):
         raw_policy = self.get_raw_policy(status=status, group=group)
-        policy = Policy.get_policy(raw_policy[0], raw_policy[1], [raw_policy[2]], raw_policy[3])
+        policy = Policy.get_policy(raw_policy[0], raw_policy[1], list(raw_policy[2]), raw_policy[3])
         return policy
 
     def get_all_policies(self, status=None):
@@ -174,11 +174,9 @@ class PolicyDB(object):
         else:
             policies = self.policies
 
-        if not policies.empty:
-            # policy_type, sources, destinations, specifics
-            return policies.apply(lambda row: Policy.get_policy(row.name[0], [row.name[3]], list(row["Destinations"]), row.name[2]), axis="columns").tolist()
-        else:
-            return list()
+        # walk the index and the destinations column side by side instead of building a Series for every row
+        return [Policy.get_policy(policy_type, [source], list(destinations), specifics)
+                for (policy_type, _, specifics, source), destinations in zip(policies.index, policies["Destinations"])]
 
     def get_query(self, environment, group=False):
         policy_type, sources, destinations, specifics = self.get_raw_policy(status=PolicyStatus.UNKNOWN, group=group)
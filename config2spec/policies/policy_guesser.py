@@ -84,14 +84,14 @@ class PolicyGuesser(object):
 
             # add all reachability policies
             for source in reachable_sources:
-                policy_source = PolicySource(source)
+                policy_source = PolicySource.get(source)
                 policy_destinations = destinations[source]
                 for policy_destination in policy_destinations:
                     policies.append((PolicyType.Reachability, policy_destination, 0, policy_source))
 
             # add all isolation policies
             for source in isolated_sources:
-                policy_source = PolicySource(source)
+                policy_source = PolicySource.get(source)
                 for policy_destination in all_destinations:
                     policies.append((PolicyType.Isolation, policy_destination, 0, policy_source))
 
@@ -126,7 +126,7 @@ class PolicyGuesser(object):
                     self.logger.error("There should only be a single destination for {node} this subnet: {subnet}.".format(node=node, subnet=subnet))
                     continue
 
-                policy_source = PolicySource(node)
+                policy_source = PolicySource.get(node)
 
                 all_paths = list(nx.all_simple_paths(forwarding_graphs[subnet], node, "sink"))
 
@@ -192,7 +192,7 @@ class PolicyGuesser(object):
             for waypoint in self.waypoints:
                 if waypoint in graph:
                     candidates = [waypoint]
-                    sources = [PolicySource(waypoint)]
+                    sources = [PolicySource.get(waypoint)]
 
                     while candidates:
                         current_node = candidates.pop()
@@ -208,7 +208,7 @@ class PolicyGuesser(object):
 
                             # prevent policies within a single router (e.g., r1 can reach r1:loopback0)
                             if not (not node_local_reachability and predecessor in dst_routers):
-                                sources.append(PolicySource(predecessor))
+                                sources.append(PolicySource.get(predecessor))
 
                     for source in sources:
                         if source.router not in dst_routers:
@@ -231,7 +231,7 @@ class PolicyGuesser(object):
 
         for dst_router, dst_interface in interfaces:
             dst_routers.add(dst_router)
-            policy_destination = PolicyDestination(dst_router, dst_interface, subnet)
+            policy_destination = PolicyDestination.get(dst_router, dst_interface, subnet)
             all_destinations.add(policy_destination)
 
             for node, _ in nx.single_target_shortest_path_length(forwarding_graph, dst_router):
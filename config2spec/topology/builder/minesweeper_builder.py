@@ -18,6 +18,20 @@ from config2spec.utils.logger import get_logger
 # initialize logging
 logger = get_logger('ConfigTopologyGenerator', 'INFO')
 
+# compiled once, the topology files are parsed line by line
+_EDGE_RE = re.compile(r"^<(?P<router1>\S+):(?P<interface1>\S+?)(?:\.(?P<vlan1>[0-9]+))?,\s"
+                      r"(?P<router2>\S+):(?P<interface2>\S+?)(?:\.(?P<vlan2>[0-9]+))?>$")
+
+_INTF_RE = re.compile(r"^## Interface:(?P<name>\S+?)(?:\.(?P<sub_id>[0-9]+))?"
+                      r"(?:;IN:(?P<in_acl>\S+?))?(?:;OUT:(?P<out_acl>\S+?))?$")
+
+_IP_RE = re.compile(r"^(?P<ip>[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})\/(?P<prefix_len>[0-9]{1,2})$")
+
+_ACL_IP = r"[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}"
+_ACL_RE = re.compile(r"^(?P<name>\S+):(?P<type>deny|permit)\sip\s"
+                     r"(?P<source>any|{ip_regex}\s{ip_regex})\s"
+                     r"(?P<destination>any|{ip_regex}\s{ip_regex})$".format(ip_regex=_ACL_IP))
+
 
 class BackendTopologyBuilder(TopologyBuilder):
     @staticmethod
@@ -51,12 +65,9 @@ class BackendTopologyBuilder(TopologyBuilder):
         routers = set()
         edges = set()
 
-        edge_regex = "^<(?P<router1>\S+):(?P<interface1>\S+?)(?:\.(?P<vlan1>[0-9]+))?,\s" \
-                     "(?P<router2>\S+):(?P<interface2>\S+?)(?:\.(?P<vlan2>[0-9]+))?>$"
-
         with open(topology_path, "r") as infile:
             for line in infile:
-                edge_match = re.match(edge_regex, line)
+                edge_match = _EDGE_RE.match(line)
                 edge_data = edge_match.groupdict()
 
                 routers.add(edge_data["router1"])
@@ -89,9 +100,7 @@ class BackendTopologyBuilder(TopologyBuilder):
                 if line.startswith("# Router:"):
                     router = line.strip().split(":")[1]
                 elif line.startswith("## Interface:"):
-                    intf_regex = "^## Interface:(?P<name>\S+?)(?:\.(?P<sub_id>[0-9]+))?" \
-                                 "(?:;IN:(?P<in_acl>\S+?))?(?:;OUT:(?P<out_acl>\S+?))?$"
-                    intf_match = re.match(intf_regex, line)
+                    intf_match = _INTF_RE.match(line)
                     intf_data = intf_match.groupdict()
 
                     if "sub_id" in intf_data and intf_data["sub_id"] is not None:
@@ -107,8 +116,7 @@ class BackendTopologyBuilder(TopologyBuilder):
                         interface.set_access_group(intf_data["out_acl"], "out")
 
                 else:
-                    ip_regex = "^(?P<ip>[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})\/(?P<prefix_len>[0-9]{1,2})$"
-                    ip_match = re.match(ip_regex, line)
+                    ip_match = _IP_RE.match(line)
                     ip_data = ip_match.groupdict()
 
                     if intf_name not in interfaces[router]:
@@ -129,13 +137,7 @@ class BackendTopologyBuilder(TopologyBuilder):
                 if line.startswith("# Router:"):
                     router = line.strip().split(":")[1]
                 else:
-                    ip_regex = "[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}"
-
-                    acl_regex = ("^(?P<name>\S+):(?P<type>deny|permit)\sip\s"
-                                 "(?P<source>any|{ip_regex}\s{ip_regex})\s"
-                                 "(?P<destination>any|{ip_regex}\s{ip_regex})$".format(ip_regex=ip_regex))
-
-                    acl_match = re.match(acl_regex, line)
+                    acl_match = _ACL_RE.match(line)
                     acl_data = acl_match.groupdict()
 
                     source = TopologyBuilder.get_prefix(acl_data["source"])
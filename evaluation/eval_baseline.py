@@ -78,6 +78,10 @@ if __name__ == '__main__':
 
         run_data = available_runs[run_id]
 
+        # the policy endpoints of the previous run are not needed anymore
+        PolicySource.clear_cache()
+        PolicyDestination.clear_cache()
+
         # all the necessary paths where config, fib and topology files are being stored
         scenario_path = os.path.join(base_path, run_data["path"])
         config_path = os.path.join(scenario_path, "configs")
@@ -145,11 +149,11 @@ if __name__ == '__main__':
             for subnet, interfaces in network.subnets.items():
                 if len(interfaces) == 1:
                     dst_router, dst_interface = interfaces[0]
-                    destinations.append(PolicyDestination(dst_router, dst_interface, subnet))
+                    destinations.append(PolicyDestination.get(dst_router, dst_interface, subnet))
 
             sources = list()
             for router in network.nodes():
-                sources.append(PolicySource(router))
+                sources.append(PolicySource.get(router))
 
             policies = list()
             for source in sources:
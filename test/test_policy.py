@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# Author: Ruediger Birkner (Networked Systems Group at ETH Zurich)
+
+import unittest
+
+from config2spec.policies.policy import LoadBalancingPolicy
+from config2spec.policies.policy import Policy
+from config2spec.policies.policy import PolicyDestination
+from config2spec.policies.policy import PolicySource
+from config2spec.policies.policy import PolicyType
+from config2spec.policies.policy import ReachabilityPolicy
+from config2spec.policies.policy import WaypointPolicy
+
+
+class PolicyTest(unittest.TestCase):
+    def tearDown(self):
+        # don't leave interned sources and destinations behind for other tests
+        PolicySource.clear_cache()
+        PolicyDestination.clear_cache()
+
+    def test_str(self):
+        sources = [PolicySource("r1"), PolicySource("r2")]
+        destinations = [PolicyDestination("r3", "FastEthernet0/0", "10.0.3.0/24")]
+
+        policy = ReachabilityPolicy(sources, destinations)
+        self.assertEqual(str(policy), "reachability policy: {r1, r2}->{r3:FastEthernet0/0 (10.0.3.0/24)}, negate=False")
+
+        policy = LoadBalancingPolicy(sources, destinations, num_paths=2)
+        self.assertEqual(str(policy), "loadbalancing policy: {r1, r2}->{r3:FastEthernet0/0 (10.0.3.0/24)}, "
+                                      "negate=False - NumPaths 2")
+
+        # the number of paths can come out of the policy db as a float
+        policy = LoadBalancingPolicy(sources, destinations, num_paths=2.0)
+        self.assertEqual(str(policy), "loadbalancing policy: {r1, r2}->{r3:FastEthernet0/0 (10.0.3.0/24)}, "
+                                      "negate=False - NumPaths 2")
+
+        policy = WaypointPolicy(sources, destinations, waypoints="r4")
+        self.assertEqual(str(policy), "waypoint policy: {r1, r2}->{r3:FastEthernet0/0 (10.0.3.0/24)}, "
+                                      "negate=False - Waypoints r4")
+
+    def test_hash_eq(self):
+        destination = PolicyDestination("r3", "FastEthernet0/0", "10.0.3.0/24")
+
+        policy1 = ReachabilityPolicy([PolicySource("r1")], [destination])
+        policy2 = ReachabilityPolicy([PolicySource("r1")], [PolicyDestination("r3", "FastEthernet0/0", "10.0.3.0/24")])
+        policy3 = ReachabilityPolicy([PolicySource("r1")], [destination], negate=True)
+
+        self.assertEqual(policy1, policy2)
+        self.assertEqual(hash(policy1), hash(policy2))
+        self.assertNotEqual(policy1, policy3)
+        self.assertEqual(len({policy1, policy2, policy3}), 2)
+
+        policy4 = LoadBalancingPolicy([PolicySource("r1")], [destination], num_paths=2)
+        policy5 = LoadBalancingPolicy([PolicySource("r1")], [destination], num_paths=3)
+        self.assertNotEqual(policy4, policy5)
+        self.assertEqual(len({policy4, policy5}), 2)
+
+        self.assertEqual(policy1, policy1)
+        self.assertNotEqual(policy1, str(policy1))
+
+        policy6 = WaypointPolicy([PolicySource("r1")], [destination], waypoints=["r2", "r4"])
+        policy7 = WaypointPolicy([PolicySource("r1")], [destination], waypoints=["r2", "r4"])
+        self.assertEqual(policy6, policy7)
+        self.assertEqual(hash(policy6), hash(policy7))
+
+    def test_ordering(self):
+        self.assertLess(PolicyType.Reachability, PolicyType.Isolation)
+        self.assertGreaterEqual(PolicyType.Waypoint, PolicyType.Waypoint)
+
+        self.assertLess(PolicySource("r1"), PolicySource("r2"))
+        self.assertLessEqual(PolicySource("r1"), PolicySource("r1"))
+        self.assertGreater(PolicySource("r2"), PolicySource("r1"))
+
+        destination1 = PolicyDestination("r1", "FastEthernet0/0", "10.0.1.0/24")
+        destination2 = PolicyDestination("r1", "FastEthernet0/1", "10.0.2.0/24")
+        destination3 = PolicyDestination("r2", "FastEthernet0/0", "10.0.3.0/24")
+        self.assertEqual(sorted([destination3, destination2, destination1]), [destination1, destination2, destination3])
+        self.assertGreater(destination2, destination1)
+        self.assertLessEqual(destination1, destination1)
+
+    def test_interning(self):
+        self.assertIs(PolicySource.get("r1"), PolicySource.get("r1"))
+        self.assertIsNot(PolicySource.get("r1"), PolicySource.get("r2"))
+        self.assertEqual(PolicySource.get("r1"), PolicySource("r1"))
+
+        destination = PolicyDestination.get("r3", "FastEthernet0/0", "10.0.3.0/24")
+        self.assertIs(destination, PolicyDestination.get("r3", "FastEthernet0/0", "10.0.3.0/24"))
+        self.assertIsNot(destination, PolicyDestination.get("r3", "FastEthernet0/1", "10.0.3.0/24"))
+        self.assertEqual(destination, PolicyDestination("r3", "FastEthernet0/0", "10.0.3.0/24"))
+
+        source = PolicySource.get("r1")
+        PolicySource.clear_cache()
+        PolicyDestination.clear_cache()
+        self.assertIsNot(PolicySource.get("r1"), source)
+        self.assertIsNot(PolicyDestination.get("r3", "FastEthernet0/0", "10.0.3.0/24"), destination)
+
+    def test_get_policy(self):
+        sources = [PolicySource("r1")]
+        destinations = [PolicyDestination("r3", "FastEthernet0/0", "10.0.3.0/24")]
+
+        policy = Policy.get_policy(PolicyType.Reachability, sources, destinations, 0)
+        self.assertEqual(policy, ReachabilityPolicy(sources, destinations, negate=False))
+
+        policy = Policy.get_policy(PolicyType.Isolation, sources, destinations, 0)
+        self.assertEqual(policy, ReachabilityPolicy(sources, destinations, negate=True))
+
+        policy = Policy.get_policy(PolicyType.Waypoint, sources, destinations, "r2")
+        self.assertEqual(policy, WaypointPolicy(sources, destinations, waypoints="r2"))
+
+        policy = Policy.get_policy(PolicyType.LoadBalancingSimple, sources, destinations, 2)
+        self.assertEqual(policy, LoadBalancingPolicy(sources, destinations, num_paths=2))
+
+        policy = Policy.get_policy(PolicyType.LoadBalancingNodeDisjoint, sources, destinations, 2)
+        self.assertIsNone(policy)
+
+
+if __name__ == "__main__":
+    unittest.main()
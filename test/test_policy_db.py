@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# Author: Ruediger Birkner (Networked Systems Group at ETH Zurich)
+
+import unittest
+
+from config2spec.policies.policy import LoadBalancingPolicy
+from config2spec.policies.policy import PolicyDestination
+from config2spec.policies.policy import PolicySource
+from config2spec.policies.policy import PolicyType
+from config2spec.policies.policy import ReachabilityPolicy
+from config2spec.policies.policy import WaypointPolicy
+from config2spec.policies.policy_db import PolicyDB
+from config2spec.policies.policy_db import PolicyStatus
+
+
+class PolicyDBTest(unittest.TestCase):
+    def setUp(self):
+        self.subnet = "10.0.1.0/24"
+        self.destination = PolicyDestination("r1", "FastEthernet0/0", self.subnet)
+
+        # a policy is a tuple of (PolicyType, Destination, Specifics, Source)
+        self.policies = [
+            (PolicyType.Reachability, self.destination, 0, PolicySource("r2")),
+            (PolicyType.Isolation, self.destination, 0, PolicySource("r3")),
+            (PolicyType.LoadBalancingSimple, self.destination, 2, PolicySource("r2")),
+            (PolicyType.Waypoint, self.destination, "r4", PolicySource("r2")),
+        ]
+
+        # the policy guesser is not used as the policies are passed directly
+        self.policy_db = PolicyDB(None)
+        self.policy_db.update_policies2(self.policies, "sample1")
+
+    def test_get_all_policies(self):
+        correct_policies = [
+            ReachabilityPolicy([PolicySource("r2")], [self.destination], negate=False),
+            ReachabilityPolicy([PolicySource("r3")], [self.destination], negate=True),
+            LoadBalancingPolicy([PolicySource("r2")], [self.destination], num_paths=2),
+            WaypointPolicy([PolicySource("r2")], [self.destination], waypoints="r4"),
+        ]
+
+        test_policies = self.policy_db.get_all_policies()
+        self.assertCountEqual(test_policies, correct_policies)
+
+        test_policies = self.policy_db.get_all_policies(status=PolicyStatus.UNKNOWN)
+        self.assertCountEqual(test_policies, correct_policies)
+
+    def test_get_all_policies_status(self):
+        self.policy_db.update_policy(PolicyType.Isolation, self.subnet, 0, PolicyStatus.HOLDS)
+
+        test_policies = self.policy_db.get_all_policies(status=PolicyStatus.HOLDS)
+        self.assertEqual(test_policies, [ReachabilityPolicy([PolicySource("r3")], [self.destination], negate=True)])
+
+        test_policies = self.policy_db.get_all_policies(status=PolicyStatus.UNKNOWN)
+        self.assertEqual(len(test_policies), 3)
+
+    def test_get_policy_group(self):
+        policy = self.policy_db.get_policy(status=PolicyStatus.UNKNOWN, group=True)
+
+        self.assertEqual(policy, ReachabilityPolicy([PolicySource("r2")], [self.destination], negate=False))
+        self.assertTrue(all(isinstance(destination, PolicyDestination) for destination in policy.destinations))
+        self.assertIn(policy, {policy})
+
+    def test_get_all_policies_empty(self):
+        self.assertEqual(self.policy_db.get_all_policies(status=PolicyStatus.HOLDSNOT), list())
+        self.assertEqual(PolicyDB(None).get_all_policies(), list())
+
+
+if __name__ == "__main__":
+    unittest.main()
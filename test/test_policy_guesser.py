@@ -28,6 +28,11 @@ class DummyNetwork(object):
 
 
 class PolicyGuessTest(unittest.TestCase):
+    def tearDown(self):
+        # the policy guesser interns sources and destinations, don't leave them behind for other tests
+        PolicySource.clear_cache()
+        PolicyDestination.clear_cache()
+
     def get_simple_network(self, local=False):
         subnet = IPv4Network("10.0.0.0/24")
 